@@ -17,23 +17,36 @@ API Version: 1.0.0
 
 import concurrent.futures
 import logging
+import shelve
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
-from urllib.request import urlopen, Request
-from urllib.error import URLError
-import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import requests
+from requests.adapters import HTTPAdapter
 from PIL import Image, ImageDraw, ImageFont
 
 from src.plugin_system.base_plugin import BasePlugin, VegasDisplayMode
 from src.common.scroll_helper import ScrollHelper
 from src.common.logo_helper import LogoHelper
-from src.common.api_helper import APIHelper
 
 logger = logging.getLogger(__name__)
 
+# Background pool for stale-while-revalidate refreshes. Refreshes are
+# coalesced per cache key so concurrent lookups never duplicate a fetch.
+_REFRESH_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="nfl_draft_refresh"
+)
+_REFRESH_LOCK = threading.Lock()
+_REFRESH_IN_FLIGHT: Dict[str, concurrent.futures.Future] = {}
+
+# Returned by conditional requests when ESPN answers 304 Not Modified
+NOT_MODIFIED = object()
+
 
 class NFLDraftPlugin(BasePlugin):
     """
@@ -55,6 +68,43 @@ class NFLDraftPlugin(BasePlugin):
     ESPN_DRAFT_CORE = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/{year}/draft"
     ESPN_DRAFT_ATHLETES = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/seasons/{year}/draft/athletes"
 
+    # Upper bound on concurrent requests when resolving athlete $ref URLs
+    FETCH_MAX_WORKERS = 20
+
+    # Cache TTL scaling: how volatile each entity is, and how active the draft is
+    TTL_ENTITY_MULTIPLIERS = {"teams": 2.0, "prospects": 1.5, "picks": 1.0, "rounds": 0.8}
+    TTL_PHASE_MULTIPLIERS = {"pre": 4.0, "live": 0.1, "complete": 10.0}
+    TTL_MIN = 30
+    TTL_MAX = 86400
+
+    # Refresh backoff multipliers and cap (see _effective_refresh_interval)
+    REFRESH_COMPLETE_MULTIPLIER = 24
+    REFRESH_NIGHT_MULTIPLIER = 4
+    REFRESH_BETWEEN_ROUNDS_MULTIPLIER = 6
+    REFRESH_ACTIVE_START_HOUR = 10
+    REFRESH_MAX_INTERVAL = 86400
+    # Pre-live polling during draft week, tighter in the evening when rounds start
+    REFRESH_DRAFT_WEEK_INTERVAL = 7200
+    REFRESH_DRAFT_EVENING_INTERVAL = 1800
+    REFRESH_DRAFT_EVENING_START_HOUR = 18
+
+    # Number of rounds in an NFL Draft
+    NFL_DRAFT_ROUNDS = 7
+
+    # On-disk fallback cache so restarts don't refetch everything from ESPN
+    DISK_CACHE_PATH = Path(__file__).parent / "cache" / "nfl_draft.shelve"
+
+    # Maximum number of rendered pick item images kept in memory
+    PICK_ITEM_CACHE_SIZE = 512
+
+    # ESPN abbreviations for all 32 teams (matches logo filenames in core assets)
+    NFL_TEAM_ABBRS = (
+        "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE",
+        "DAL", "DEN", "DET", "GB", "HOU", "IND", "JAX", "KC",
+        "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO", "NYG",
+        "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WSH",
+    )
+
     def __init__(self, plugin_id: str, config: Dict[str, Any],
                  display_manager, cache_manager, plugin_manager):
         """Initialize the NFL Draft plugin."""
@@ -64,10 +114,42 @@ class NFLDraftPlugin(BasePlugin):
         self.display_width = display_manager.matrix.width
         self.display_height = display_manager.matrix.height
 
+        # Resources released by cleanup(), set up front so it works after a partial init
+        self.scroll_helper: Optional[ScrollHelper] = None
+        self.logo_helper: Optional[LogoHelper] = None
+        self._http_session: Optional[requests.Session] = None
+
+        # Single worker for update() network I/O, so display() never waits on ESPN
+        self._update_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="nfl_draft_update"
+        )
+        self._pending_update: Optional[concurrent.futures.Future] = None
+
+        # Rendered image caches (LRU of pick items, and round labels by number)
+        self._pick_item_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+        self._round_label_cache: Dict[int, Image.Image] = {}
+        self._logo_cache: Dict[str, Optional[Image.Image]] = {}
+        self._logo_lock = threading.Lock()
+        # Item images of the current scroll, shared with Vegas mode
+        self._content_items: List[Image.Image] = []
+        # Full-display status message frames ("No Draft Data", "Error") by message
+        self._message_images: Dict[str, Image.Image] = {}
+
+        # Persistent fallback cache (opened lazily, shared with refresh threads).
+        # Once closed by cleanup() it stays closed, even for late refreshes.
+        self._disk_cache: Optional[shelve.Shelf] = None
+        self._disk_cache_closed = False
+        self._disk_cache_lock = threading.Lock()
+
+        # Text widths memoized by (size, text)
+        self._text_width_cache: Dict[Tuple[int, str], int] = {}
+
         # Initialize helpers
         self.scroll_helper = ScrollHelper(self.display_width, self.display_height, self.logger)
         self.logo_helper = LogoHelper(self.display_width, self.display_height, logger=self.logger)
-        self.api_helper = APIHelper(cache_manager, logger=self.logger)
+
+        # Pooled HTTP session shared by every ESPN request so connections are reused
+        self._http_session = self._create_http_session()
 
         # Load configuration
         self._load_config()
@@ -79,10 +161,28 @@ class NFLDraftPlugin(BasePlugin):
         self.current_round = 1
         self.last_update_time: Optional[float] = None
         self.last_live_check_time: Optional[float] = None
+        # Validators (ETag / Last-Modified) of the data behind the current scroll image
+        self._rendered_version: Optional[tuple] = None
+        # Index of the on-the-clock pick and a hash of the picks behind the current scroll
+        self._on_clock_idx: Optional[int] = None
+        self._last_picks_hash: Optional[int] = None
+        # Hash of the last frame pushed to the matrix (None forces the next push)
+        self._last_frame_hash: Optional[int] = None
+        # Set when draft_picks changed; the scroll image is rebuilt on next use
+        self._scroll_dirty = False
+        # Dynamic duration of the current scroll image (None until asked for)
+        self._display_duration: Optional[float] = None
+
+        # Text measurement: one shared draw context for all width lookups
+        self._measure_draw = ImageDraw.Draw(Image.new('RGB', (1, 1)))
 
         # Font loading - separate sizes for player name vs details
-        self.player_name_font = self._load_font(self.player_name_font_size)
-        self.detail_font = self._load_font(self.detail_font_size)
+        self._font_by_size: Dict[Tuple[str, int], ImageFont.ImageFont] = {}
+        self.player_name_font = self._get_font(self.player_name_font_size)
+        self.detail_font = self._get_font(self.detail_font_size)
+
+        # Round labels are static for a given font, so render them all up front
+        self._build_round_labels()
 
         # Logo path (using core LEDMatrix assets)
         self.logo_base_path = Path("assets/sports/nfl_logos")
@@ -91,6 +191,11 @@ class NFLDraftPlugin(BasePlugin):
         self._ensure_logo_installed()
         self.nfl_draft_logo = self._load_nfl_draft_logo()
 
+        # Warm the team logo cache off the main thread so scroll rebuilds never hit disk
+        threading.Thread(
+            target=self._preload_team_logos, name="nfl_draft_logo_preload", daemon=True
+        ).start()
+
         self.logger.info(f"NFL Draft plugin initialized for year {self.draft_year}")
 
     def _load_config(self) -> None:
@@ -120,7 +225,7 @@ class NFLDraftPlugin(BasePlugin):
         self.scroll_helper.set_scroll_speed(self.scroll_speed)
 
         # Refresh intervals
-        self.live_refresh_interval = self.config.get("live_refresh_interval", 600)  # 10 minutes
+        self.live_refresh_interval = self.config.get("live_refresh_interval", 60)  # 1 minute
         self.projection_refresh_interval = self.config.get("projection_refresh_interval", 86400)  # 24 hours
 
         # Display settings
@@ -136,6 +241,9 @@ class NFLDraftPlugin(BasePlugin):
         else:
             self.logo_size = logo_size_config
 
+        # NFL Draft header logo resampling (LANCZOS when true, faster BICUBIC otherwise)
+        self.high_quality_logo_resize = self.config.get("high_quality_logo_resize", False)
+
         # Dynamic duration settings
         dynamic_duration = self.config.get("dynamic_duration", {})
         self.dynamic_duration_enabled = dynamic_duration.get("enabled", True)
@@ -161,12 +269,20 @@ class NFLDraftPlugin(BasePlugin):
         if self.simulate_live:
             self.draft_year = self.simulate_year
 
+        # NFL Draft typically occurs last week of April (Thursday-Saturday);
+        # store the fallback detection window as epoch seconds
+        self._draft_window = (
+            datetime(self.draft_year, 4, 20).timestamp(),
+            datetime(self.draft_year, 4, 27).timestamp()
+        )
+
         # Favorite teams for live-mode highlights (up to 3 abbreviations)
         fav_raw = self.config.get("favorite_teams", [])
         if isinstance(fav_raw, list):
             self.favorite_teams = [str(t).upper().strip() for t in fav_raw if t][:3]
         else:
             self.favorite_teams = []
+        self._favorite_set = frozenset(self.favorite_teams)
 
     def _load_font(self, size: int) -> ImageFont.ImageFont:
         """Load configured font at specified size."""
@@ -179,6 +295,31 @@ class NFLDraftPlugin(BasePlugin):
 
         return ImageFont.load_default()
 
+    def _get_font(self, size: int) -> ImageFont.ImageFont:
+        """Return the configured font at size, loading each (font, size) pair only once."""
+        key = (self.font_name, size)
+        font = self._font_by_size.get(key)
+        if font is None:
+            font = self._load_font(size)
+            self._font_by_size[key] = font
+        return font
+
+    def _measure(self, text: str, font: ImageFont.ImageFont, font_size: int) -> int:
+        """Return the rendered width of text in font, memoized per (font_size, text)."""
+        key = (font_size, text)
+        width = self._text_width_cache.get(key)
+        if width is None:
+            # Fonts with getlength measure without going through a draw context
+            getlength = getattr(font, "getlength", None)
+            if getlength is not None:
+                width = int(getlength(text))
+            else:
+                # Fallback for older PIL versions
+                bbox = self._measure_draw.textbbox((0, 0), text, font=font)
+                width = bbox[2] - bbox[0]
+            self._text_width_cache[key] = width
+        return width
+
     def _get_current_draft_year(self) -> int:
         """Determine the current/upcoming draft year."""
         now = datetime.now()
@@ -188,23 +329,325 @@ class NFLDraftPlugin(BasePlugin):
             return now.year
         return now.year + 1
 
+    def _create_http_session(self) -> requests.Session:
+        """Create a session whose connection pool matches the fetch concurrency."""
+        session = requests.Session()
+        session.headers.update({'User-Agent': 'Mozilla/5.0'})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.FETCH_MAX_WORKERS
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get_json(self, url: str, timeout: float = 10) -> Dict[str, Any]:
+        """
+        GET an ESPN JSON document over the shared session.
+
+        Raises:
+            requests.RequestException: On connection errors or HTTP error status
+            ValueError: If the body is not valid JSON
+        """
+        response = self._http_session.get(url, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def _get_json_conditional(self, url: str, validators: Dict[str, Optional[str]],
+                              timeout: float = 10) -> Tuple[Any, Dict[str, Optional[str]]]:
+        """
+        GET a JSON document, revalidating with ETag / Last-Modified when known.
+
+        Args:
+            url: Document URL
+            validators: {'etag', 'last_modified'} from a previous response (may be empty)
+            timeout: Request timeout in seconds
+
+        Returns:
+            (data, validators) — data is NOT_MODIFIED on HTTP 304, and validators
+            are the ones to send next time
+
+        Raises:
+            requests.RequestException: On connection errors or HTTP error status
+        """
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = self._http_session.get(url, headers=headers, timeout=timeout)
+        if response.status_code == 304:
+            return NOT_MODIFIED, validators
+        response.raise_for_status()
+
+        new_validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        return response.json(), new_validators
+
+    def _fetch_json(self, url: str, timeout: float = 10) -> Optional[Dict[str, Any]]:
+        """Fetch a single ESPN JSON document, returning None on any failure."""
+        if not url:
+            return None
+        try:
+            return self._get_json(url, timeout)
+        except Exception as e:
+            self.logger.debug(f"Failed to fetch {url}: {e}")
+            return None
+
+    def _fetch_json_many(self, urls: List[str], timeout: float = 10,
+                         transform: Optional[Callable[[Dict[str, Any]], Any]] = None) -> List[Any]:
+        """
+        Fetch many ESPN JSON documents concurrently.
+
+        All $ref fan-outs share one worker pool so the number of in-flight
+        requests to ESPN is bounded in a single place.
+
+        Args:
+            urls: Document URLs to fetch
+            timeout: Per-request timeout in seconds
+            transform: Optional callable applied to each document inside the
+                worker, so only the extracted fields outlive the full payload
+
+        Returns:
+            Results index-aligned with urls (None for failed or empty URLs)
+        """
+        if not urls:
+            return []
+
+        def fetch(url: str) -> Any:
+            doc = self._fetch_json(url, timeout)
+            if doc is None or transform is None:
+                return doc
+            return transform(doc)
+
+        workers = min(self.FETCH_MAX_WORKERS, len(urls))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, urls))
+
+    def _compute_ttl(self, entity: str) -> int:
+        """
+        Compute a cache TTL for an entity based on its volatility and the draft phase.
+
+        The base is the configured refresh interval for the current mode, scaled
+        by TTL_ENTITY_MULTIPLIERS and TTL_PHASE_MULTIPLIERS and clamped to
+        [TTL_MIN, TTL_MAX].
+
+        Args:
+            entity: One of 'teams', 'prospects', 'picks', 'rounds'
+
+        Returns:
+            TTL in seconds
+        """
+        base_ttl = self.live_refresh_interval if self.is_draft_live else self.projection_refresh_interval
+        ttl = (base_ttl
+               * self.TTL_ENTITY_MULTIPLIERS.get(entity, 1.0)
+               * self.TTL_PHASE_MULTIPLIERS.get(self.draft_status, 1.0))
+        return int(min(max(ttl, self.TTL_MIN), self.TTL_MAX))
+
+    def _open_disk_cache(self) -> Optional[shelve.Shelf]:
+        """Open the on-disk cache on first use. Caller must hold _disk_cache_lock."""
+        if self._disk_cache is None and not self._disk_cache_closed:
+            try:
+                self.DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                self._disk_cache = shelve.open(str(self.DISK_CACHE_PATH), writeback=False)
+            except Exception as e:
+                self.logger.warning(f"Disk cache unavailable at {self.DISK_CACHE_PATH}: {e}")
+        return self._disk_cache
+
+    def _disk_cache_get(self, key: str) -> Any:
+        """Return an unexpired value from the on-disk cache, or None."""
+        with self._disk_cache_lock:
+            db = self._open_disk_cache()
+            if db is None:
+                return None
+            try:
+                entry = db.get(key)
+            except Exception as e:
+                self.logger.debug(f"Disk cache read failed for {key}: {e}")
+                return None
+        if not entry or entry.get("expiry", 0) < time.time():
+            return None
+        return entry.get("value")
+
+    def _disk_cache_set(self, key: str, value: Any, ttl: float) -> None:
+        """Write a value through to the on-disk cache."""
+        with self._disk_cache_lock:
+            db = self._open_disk_cache()
+            if db is None:
+                return
+            try:
+                db[key] = {"expiry": time.time() + ttl, "value": value}
+                db.sync()
+            except Exception as e:
+                self.logger.debug(f"Disk cache write failed for {key}: {e}")
+
+    def _get_swr(self, cache_key: str, fetch_fn: Callable[[], Any],
+                 ttl: float, stale_window: float, background: bool = True) -> Any:
+        """
+        Stale-while-revalidate cache lookup.
+
+        Entries younger than ttl are returned as-is. Entries older than ttl but
+        within ttl + stale_window are returned immediately while a background
+        refresh is scheduled, so the render loop never waits on ESPN at a TTL
+        boundary. Only a cold miss fetches synchronously, unless background is
+        False: then a stale entry is revalidated synchronously too, and only
+        served if that refresh fails.
+
+        Args:
+            cache_key: Cache manager key for the wrapped entry
+            fetch_fn: Zero-argument callable returning fresh data (falsy on failure)
+            ttl: Seconds an entry is considered fresh
+            stale_window: Extra seconds a stale entry may still be served
+            background: Refresh stale entries on the background pool
+
+        Returns:
+            Cached or freshly fetched data, or the falsy fetch result on failure
+        """
+        entry = self._get_swr_entry(cache_key)
+        if entry is not None:
+            age = time.time() - entry["cached_at"]
+            if age <= ttl:
+                return entry["data"]
+            if age <= ttl + stale_window:
+                if not background:
+                    return self._refresh_swr(cache_key, fetch_fn, ttl, stale_window) or entry["data"]
+                self._schedule_swr_refresh(cache_key, fetch_fn, ttl, stale_window)
+                return entry["data"]
+
+        return self._refresh_swr(cache_key, fetch_fn, ttl, stale_window)
+
+    def _get_swr_entry(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return the {'data', 'cached_at'} entry stored by _refresh_swr, or None."""
+        entry = self.cache_manager.get(cache_key)
+        if not (isinstance(entry, dict) and "cached_at" in entry):
+            # Cold start: fall back to the last entry persisted to disk
+            entry = self._disk_cache_get(cache_key)
+        if isinstance(entry, dict) and "cached_at" in entry:
+            return entry
+        return None
+
+    def _refresh_swr(self, cache_key: str, fetch_fn: Callable[[], Any],
+                     ttl: float, stale_window: float) -> Any:
+        """
+        Run fetch_fn and store a successful result for _get_swr.
+
+        fetch_fn may return NOT_MODIFIED after a conditional request, in which
+        case the existing entry is re-stamped as fresh and its data returned.
+        """
+        data = fetch_fn()
+        not_modified = data is NOT_MODIFIED
+        if not_modified:
+            entry = self._get_swr_entry(cache_key)
+            data = entry["data"] if entry else None
+        if data:
+            entry = {"data": data, "cached_at": time.time()}
+            self.cache_manager.set(cache_key, entry, ttl=ttl + stale_window)
+            # The disk copy only matters across restarts; rewrite it when the data changed
+            if not not_modified:
+                self._disk_cache_set(cache_key, entry, ttl + stale_window)
+        return data
+
+    def _schedule_swr_refresh(self, cache_key: str, fetch_fn: Callable[[], Any],
+                              ttl: float, stale_window: float) -> None:
+        """Submit a background refresh for cache_key unless one is already in flight."""
+        with _REFRESH_LOCK:
+            pending = _REFRESH_IN_FLIGHT.get(cache_key)
+            if pending is not None and not pending.done():
+                return
+            future = _REFRESH_EXECUTOR.submit(
+                self._refresh_swr, cache_key, fetch_fn, ttl, stale_window
+            )
+            _REFRESH_IN_FLIGHT[cache_key] = future
+
+        self.logger.debug(f"Serving stale {cache_key} while refreshing in background")
+
+        def _on_done(f: concurrent.futures.Future) -> None:
+            with _REFRESH_LOCK:
+                if _REFRESH_IN_FLIGHT.get(cache_key) is f:
+                    del _REFRESH_IN_FLIGHT[cache_key]
+            if f.exception() is not None:
+                self.logger.error(f"Background refresh of {cache_key} failed: {f.exception()}")
+
+        future.add_done_callback(_on_done)
+
     def _fetch_draft_data(self) -> Dict[str, Any]:
         """
         Fetch draft data from ESPN site API.
 
         This endpoint provides mock draft picks with team projections (pre-draft)
         or actual draft results (post-draft).
+
+        The TTL follows the status-driven refresh cadence, so every poll
+        revalidates (conditionally) instead of reading a copy cached under an
+        earlier, slower phase. The entry itself is kept for TTL_MAX beyond that
+        so its validators are still there to send on the next poll; as this is
+        called from the update thread, a stale entry is revalidated
+        synchronously and only served if ESPN can't be reached.
         """
         cache_key = f"nfl_draft_site_{self.draft_year}"
-        cache_ttl = self.live_refresh_interval if self.is_draft_live else self.projection_refresh_interval
-
-        data = self.api_helper.get(
-            self.ESPN_DRAFT_SITE,
-            cache_key=cache_key,
-            cache_ttl=cache_ttl
+        cache_ttl = min(self._compute_ttl("picks"), self._effective_refresh_interval())
+
+        data = self._get_swr(
+            cache_key,
+            lambda: self._fetch_site_data(cache_key),
+            ttl=cache_ttl,
+            stale_window=self.TTL_MAX,
+            background=False
         )
         return data or {}
 
+    def _fetch_site_data(self, cache_key: str) -> Any:
+        """
+        Fetch the site API draft document, revalidating the cached copy if any.
+
+        The response's ETag / Last-Modified are stored inside the document under
+        '_validators' so they always describe the data they were served with.
+
+        Returns:
+            The draft document, NOT_MODIFIED on HTTP 304, or None on failure
+        """
+        entry = self._get_swr_entry(cache_key)
+        validators = entry["data"].get("_validators", {}) if entry else {}
+        try:
+            data, validators = self._get_json_conditional(
+                self.ESPN_DRAFT_SITE, validators, timeout=15
+            )
+        except Exception as e:
+            self.logger.debug(f"Failed to fetch {self.ESPN_DRAFT_SITE}: {e}")
+            return None
+
+        if data is NOT_MODIFIED:
+            return NOT_MODIFIED
+        data["_validators"] = validators
+        return data
+
+    def _draft_data_validators(self, data: Dict[str, Any], draft_status: str) -> Optional[tuple]:
+        """
+        Identify the version of the inputs behind the current picks.
+
+        Combines the site document's validators with the prospects list's
+        (pre-draft mock picks depend on both). When ESPN sent no validators,
+        live and completed drafts fall back to a signature of the status and
+        each raw pick's number, team and athlete; pre-draft returns None, meaning changes cannot be detected.
+        """
+        site = data.get("_validators") or {}
+        if not (site.get("etag") or site.get("last_modified")):
+            if draft_status == "pre" or "picks" not in data:
+                return None
+            status = data.get("status") or {}
+            return ("picks", status.get("state"), status.get("round"), hash(tuple(
+                (p.get("overall"), p.get("teamId"), (p.get("athlete") or {}).get("id"))
+                for p in data["picks"]
+            )))
+        version: tuple = (site.get("etag"), site.get("last_modified"))
+        if draft_status == "pre":
+            prospects = self.cache_manager.get(f"nfl_draft_prospects_{self.draft_year}:etag") or {}
+            version += (prospects.get("etag"), prospects.get("last_modified"))
+        return version
+
     def _fetch_all_prospects(self) -> List[Dict[str, Any]]:
         """
         Fetch all draft prospects from ESPN core API.
@@ -215,15 +658,25 @@ class NFLDraftPlugin(BasePlugin):
         Returns:
             List of prospect dictionaries sorted by overall rank
         """
-        cache_key = f"nfl_draft_prospects_{self.draft_year}"
+        data = self._get_swr(
+            f"nfl_draft_prospects_{self.draft_year}",
+            self._download_prospects,
+            ttl=self._compute_ttl("prospects"),
+            stale_window=self._compute_ttl("prospects")
+        )
+        return data or []
 
-        # Check cache first
-        cached_data = self.cache_manager.get(cache_key)
-        if cached_data:
-            self.logger.debug("Using cached prospect data")
-            return cached_data
+    def _download_prospects(self) -> List[Dict[str, Any]]:
+        """
+        Download and rank draft prospects from ESPN core API.
 
+        The athletes list is revalidated with its last ETag / Last-Modified;
+        when ESPN answers 304 the previously ranked prospects are returned
+        without re-fetching any athlete documents.
+        """
         prospects = []
+        cache_key = f"nfl_draft_prospects_{self.draft_year}"
+        validators_key = f"{cache_key}:etag"
 
         try:
             # Get list of all draft athletes
@@ -232,9 +685,18 @@ class NFLDraftPlugin(BasePlugin):
 
             self.logger.info(f"Fetching draft athletes list from {athletes_url}")
 
-            req = Request(athletes_url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urlopen(req, timeout=30) as response:
-                data = json.loads(response.read().decode())
+            # Only revalidate if there is a cached list to fall back on
+            previous = self._get_swr_entry(cache_key)
+            validators = (self.cache_manager.get(validators_key) or {}) if previous else {}
+
+            data, validators = self._get_json_conditional(athletes_url, validators, timeout=30)
+            if data is NOT_MODIFIED:
+                self.logger.info("Draft athletes list not modified; reusing cached prospects")
+                # Keep the validators alive for as long as the list keeps revalidating
+                self.cache_manager.set(
+                    validators_key, validators, ttl=2 * self._compute_ttl("prospects")
+                )
+                return previous["data"]
 
             items = data.get("items", [])
             self.logger.info(f"Found {len(items)} athlete references")
@@ -249,67 +711,64 @@ class NFLDraftPlugin(BasePlugin):
                 if url:
                     athlete_urls.append(url)
 
-            # Fetch athlete details in parallel (limit concurrency)
-            def fetch_athlete(url: str) -> Optional[Dict[str, Any]]:
-                try:
-                    req = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                    with urlopen(req, timeout=10) as response:
-                        return json.loads(response.read().decode())
-                except Exception as e:
-                    self.logger.debug(f"Failed to fetch athlete: {e}")
-                    return None
-
-            # Use ThreadPoolExecutor for parallel fetching
-            with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-                athlete_data = list(executor.map(fetch_athlete, athlete_urls[:150]))  # Limit to top 150
-
-            # Process athlete data
-            for athlete in athlete_data:
-                if not athlete:
-                    continue
-
-                # Extract overall rank from attributes
-                overall_rank = 999
-                for attr in athlete.get("attributes", []):
-                    if attr.get("name") == "overall":
-                        try:
-                            overall_rank = int(float(attr.get("value", 999)))
-                        except (ValueError, TypeError):
-                            pass
-
-                # Get position
-                position = athlete.get("position", {})
-                pos_abbr = position.get("abbreviation", "") if isinstance(position, dict) else ""
-
-                # Get college team
-                college = ""
-                college_team = athlete.get("team", {})
-                if college_team:
-                    college = college_team.get("shortDisplayName", college_team.get("name", ""))
-
-                prospect = {
-                    "id": athlete.get("id"),
-                    "displayName": athlete.get("displayName", "Unknown"),
-                    "position": pos_abbr,
-                    "college": college,
-                    "overall_rank": overall_rank
-                }
-                prospects.append(prospect)
+            # Fetch athlete details in parallel (limit to top 150), reducing each
+            # payload to a prospect dict as soon as it arrives
+            athlete_data = self._fetch_json_many(athlete_urls[:150], transform=self._parse_prospect)
+            prospects = [p for p in athlete_data if p]
 
             # Sort by overall rank
-            prospects.sort(key=lambda x: x.get("overall_rank", 999))
+            prospects.sort(key=itemgetter("overall_rank"))
 
             self.logger.info(f"Fetched and ranked {len(prospects)} prospects")
 
-            # Cache the results
-            if prospects:
-                self.cache_manager.set(cache_key, prospects, ttl=self.projection_refresh_interval)
+            if prospects and (validators.get("etag") or validators.get("last_modified")):
+                self.cache_manager.set(
+                    validators_key, validators, ttl=2 * self._compute_ttl("prospects")
+                )
 
         except Exception as e:
             self.logger.error(f"Error fetching prospects: {e}", exc_info=True)
 
         return prospects
 
+    @staticmethod
+    def _parse_prospect(athlete: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the fields used for mock drafts from a core API athlete document."""
+        # Extract overall rank from attributes (stops at the first 'overall' entry)
+        try:
+            overall_rank = next(
+                (int(float(a.get("value", 999)))
+                 for a in athlete.get("attributes", ()) if a.get("name") == "overall"),
+                999
+            )
+        except (ValueError, TypeError):
+            overall_rank = 999
+
+        # Get position
+        position = athlete.get("position", {})
+        pos_abbr = position.get("abbreviation", "") if isinstance(position, dict) else ""
+
+        # Get college team
+        college_team = athlete.get("team") or {}
+        college = college_team.get("shortDisplayName") or college_team.get("name", "")
+
+        return {
+            "id": athlete.get("id"),
+            "displayName": athlete.get("displayName", "Unknown"),
+            "position": pos_abbr,
+            "college": college,
+            "overall_rank": overall_rank
+        }
+
+    @staticmethod
+    def _parse_pick_athlete(athlete: Dict[str, Any]) -> Dict[str, str]:
+        """Extract player name and position from a core API draft athlete document."""
+        pos = athlete.get("position", {})
+        return {
+            "player_name": athlete.get("displayName", "TBD"),
+            "position": pos.get("abbreviation", "") if isinstance(pos, dict) else "",
+        }
+
     def _fetch_nfl_teams(self) -> Dict[str, str]:
         """
         Fetch NFL team ID → abbreviation mapping from ESPN site API.
@@ -317,17 +776,20 @@ class NFLDraftPlugin(BasePlugin):
         Returns:
             Dict mapping team ID string to team abbreviation (e.g. {'10': 'KC'})
         """
-        cache_key = "nfl_teams_lookup"
-        cached = self.cache_manager.get(cache_key)
-        if cached:
-            return cached
+        data = self._get_swr(
+            "nfl_teams_lookup",
+            self._download_nfl_teams,
+            ttl=self._compute_ttl("teams"),
+            stale_window=self._compute_ttl("teams")
+        )
+        return data or {}
 
+    def _download_nfl_teams(self) -> Dict[str, str]:
+        """Download the NFL team ID → abbreviation mapping (uncached)."""
         teams: Dict[str, str] = {}
         try:
             url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/teams?limit=50"
-            req = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urlopen(req, timeout=15) as response:
-                data = json.loads(response.read().decode())
+            data = self._get_json(url, timeout=15)
 
             # Response: {"sports": [{"leagues": [{"teams": [...]}]}]}
             for entry in (data.get("sports", [{}])[0]
@@ -340,8 +802,6 @@ class NFLDraftPlugin(BasePlugin):
                     teams[team_id] = abbr
 
             self.logger.info(f"Fetched {len(teams)} NFL team abbreviations")
-            if teams:
-                self.cache_manager.set(cache_key, teams, ttl=86400)
 
         except Exception as e:
             self.logger.error(f"Error fetching NFL teams: {e}")
@@ -361,23 +821,20 @@ class NFLDraftPlugin(BasePlugin):
         """
         year = self.simulate_year
         cache_key = f"nfl_draft_historical_{year}"
-        cached = self.cache_manager.get(cache_key)
+        cached = self.cache_manager.get(cache_key) or self._disk_cache_get(cache_key)
         if cached:
             self.logger.debug(f"Using cached historical picks for {year}")
             return cached
 
-        teams_lookup = self._fetch_nfl_teams()
         picks: List[Dict[str, Any]] = []
 
         try:
-            # Picks are inline in the rounds list — each item is a full round object
-            rounds_url = (
-                f"https://sports.core.api.espn.com/v2/sports/football/leagues/nfl"
-                f"/seasons/{year}/draft/rounds?lang=en&region=us&limit=10"
-            )
-            req = Request(rounds_url, headers={'User-Agent': 'Mozilla/5.0'})
-            with urlopen(req, timeout=15) as response:
-                rounds_data = json.loads(response.read().decode())
+            # The team lookup and the rounds list are independent — fetch both at once
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                teams_future = executor.submit(self._fetch_nfl_teams)
+                rounds_future = executor.submit(self._fetch_rounds_blob, year)
+                teams_lookup = teams_future.result()
+                rounds_data = rounds_future.result()
 
             # Collect picks from all rounds in the response
             raw_picks: List[Tuple[int, Dict]] = []
@@ -393,19 +850,7 @@ class NFLDraftPlugin(BasePlugin):
                 pick.get("athlete", {}).get("$ref", "") for (_rn, pick) in raw_picks
             ]
 
-            def fetch_athlete_ref(url: str) -> Optional[Dict]:
-                if not url:
-                    return None
-                try:
-                    req = Request(url, headers={'User-Agent': 'Mozilla/5.0'})
-                    with urlopen(req, timeout=10) as response:
-                        return json.loads(response.read().decode())
-                except Exception as e:
-                    self.logger.debug(f"Failed to fetch athlete ref: {e}")
-                    return None
-
-            with concurrent.futures.ThreadPoolExecutor(max_workers=15) as executor:
-                athlete_results = list(executor.map(fetch_athlete_ref, athlete_urls))
+            athlete_results = self._fetch_json_many(athlete_urls, transform=self._parse_pick_athlete)
 
             # Build standardised pick dicts
             for i, (round_num, raw_pick) in enumerate(raw_picks):
@@ -419,10 +864,8 @@ class NFLDraftPlugin(BasePlugin):
                 player_name = "TBD"
                 position = ""
                 if athlete:
-                    player_name = athlete.get("displayName", "TBD")
-                    pos = athlete.get("position", {})
-                    if isinstance(pos, dict):
-                        position = pos.get("abbreviation", "")
+                    player_name = athlete["player_name"]
+                    position = athlete["position"]
                     # Note: athlete.college and athlete.team are $ref objects in the
                     # draft API; college name is not available without extra fetches.
 
@@ -444,14 +887,30 @@ class NFLDraftPlugin(BasePlugin):
             self.logger.info(f"Fetched {len(picks)} historical picks for {year}")
 
             if picks:
-                self.cache_manager.set(cache_key, picks, ttl=86400)
+                ttl = self._compute_ttl("rounds")
+                self.cache_manager.set(cache_key, picks, ttl=ttl)
+                self._disk_cache_set(cache_key, picks, ttl)
 
         except Exception as e:
             self.logger.error(f"Error fetching historical picks: {e}", exc_info=True)
 
         return picks
 
-    def _fetch_draft_picks(self, round_num: Optional[int] = None) -> List[Dict[str, Any]]:
+    def _fetch_rounds_blob(self, year: int) -> Dict[str, Any]:
+        """
+        Fetch the core API rounds list for a draft year.
+
+        Picks are inline in the rounds list — each item is a full round object.
+        """
+        rounds_url = (
+            f"https://sports.core.api.espn.com/v2/sports/football/leagues/nfl"
+            f"/seasons/{year}/draft/rounds?lang=en&region=us&limit=10"
+        )
+        return self._get_json(rounds_url, timeout=15)
+
+    def _fetch_draft_picks(self, round_num: Optional[int] = None,
+                           data: Optional[Dict[str, Any]] = None,
+                           draft_status: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Fetch draft picks from ESPN site API.
 
@@ -460,34 +919,26 @@ class NFLDraftPlugin(BasePlugin):
 
         Args:
             round_num: Specific round to fetch, or None for all configured rounds
+            data: Site API response already fetched by the caller, if any
+            draft_status: Status parsed from data by the caller; defaults to
+                the response's own status, then self.draft_status
 
         Returns:
             List of draft pick dictionaries
         """
         picks = []
 
-        data = self._fetch_draft_data()
+        if data is None:
+            data = self._fetch_draft_data()
 
         if not data:
             self.logger.warning("No draft data returned from ESPN API")
             return picks
 
-        # Update draft status from the response
-        status = data.get("status", {})
-        if status:
-            state = status.get("state", "").lower()
-            if state == "in":
-                self.draft_status = "live"
-                self.is_draft_live = True
-            elif state == "post":
-                self.draft_status = "complete"
-            else:
-                self.draft_status = "pre"
-
-            # Get current round from status
-            current_round = status.get("round", 1)
-            if isinstance(current_round, int):
-                self.current_round = current_round
+        # Pre-draft picks are mock picks built from the prospect rankings
+        if draft_status is None:
+            parsed = self._parse_draft_status(data)
+            draft_status = parsed[0] if parsed else self.draft_status
 
         # Build team lookup (teamId -> team info)
         teams_lookup = {}
@@ -502,8 +953,10 @@ class NFLDraftPlugin(BasePlugin):
 
         # Get all prospects for mock draft (pre-draft mode)
         # Fetch from core API to get full prospect list with rankings
-        prospects = self._fetch_all_prospects() if self.draft_status == "pre" else []
-        self.logger.info(f"Found {len(prospects)} prospects for mock draft")
+        is_pre = draft_status == "pre"
+        prospects = self._fetch_all_prospects() if is_pre else []
+        num_prospects = len(prospects)
+        self.logger.info(f"Found {num_prospects} prospects for mock draft")
 
         # Build picks list
         for idx, raw_pick in enumerate(raw_picks):
@@ -530,22 +983,22 @@ class NFLDraftPlugin(BasePlugin):
             }
 
             # For pre-draft, match with prospect by rank
-            if self.draft_status == "pre" and idx < len(prospects):
+            athlete = raw_pick.get("athlete")
+            if is_pre and idx < num_prospects:
                 prospect = prospects[idx]
                 pick_data["player_name"] = prospect.get("displayName", "TBD")
                 pick_data["position"] = prospect.get("position", "")
                 pick_data["college"] = prospect.get("college", "")
 
             # For live/post draft, use athlete data if available
-            elif raw_pick.get("athlete"):
-                athlete = raw_pick["athlete"]
+            elif athlete:
                 pick_data["player_name"] = athlete.get("displayName", "TBD")
                 position = athlete.get("position", {})
                 if isinstance(position, dict):
                     pick_data["position"] = position.get("abbreviation", "")
                 college_team = athlete.get("team", {})
                 if college_team and isinstance(college_team, dict):
-                    pick_data["college"] = college_team.get("shortDisplayName", college_team.get("name", ""))
+                    pick_data["college"] = college_team.get("shortDisplayName") or college_team.get("name", "")
 
             # Only add if we have meaningful data
             if pick_data["team_abbr"] or pick_data["player_name"] != "TBD":
@@ -553,44 +1006,58 @@ class NFLDraftPlugin(BasePlugin):
 
         return picks
 
+    @staticmethod
+    def _parse_draft_status(data: Dict[str, Any]) -> Optional[Tuple[str, Optional[int]]]:
+        """
+        Read the draft status from a site API response without applying it.
+
+        Returns:
+            (draft_status, current_round) where draft_status is 'pre', 'live'
+            or 'complete' and current_round is None if ESPN sent none, or None
+            if the response has no status block
+        """
+        status = data.get("status", {})
+        if not status:
+            return None
+
+        state = status.get("state", "").lower()
+        if state == "in":
+            draft_status = "live"
+        elif state == "post":
+            draft_status = "complete"
+        else:
+            draft_status = "pre"
+
+        # Get current round from status
+        current_round = status.get("round", 1)
+        return draft_status, current_round if isinstance(current_round, int) else None
+
+    def _apply_draft_status(self, status: Tuple[str, Optional[int]]) -> None:
+        """Install a status from _parse_draft_status as draft_status, is_draft_live and current_round."""
+        draft_status, current_round = status
+        self.draft_status = draft_status
+        self.is_draft_live = draft_status == "live"
+        if current_round is not None:
+            self.current_round = current_round
+
     def _check_draft_live_status(self) -> bool:
         """
         Check if the NFL Draft is currently live.
 
-        Uses the site API status field which is updated in _fetch_draft_picks.
-        Falls back to date-based detection.
+        Reads the status that update() last parsed from the site API instead
+        of fetching it again. Falls back to date-based detection until a
+        status has been seen.
 
         Returns:
             True if draft is live, False otherwise
         """
-        # First try to get status from site API
-        data = self._fetch_draft_data()
-
-        if data:
-            status = data.get("status", {})
-            if status:
-                state = status.get("state", "").lower()
-                if state == "in":
-                    self.draft_status = "live"
-                    return True
-                elif state == "post":
-                    self.draft_status = "complete"
-                    return False
-                else:
-                    self.draft_status = "pre"
-                    return False
-
-        # Fallback: check by date
+        if self.draft_status in ("pre", "live", "complete"):
+            return self.draft_status == "live"
         return self._is_draft_date()
 
     def _is_draft_date(self) -> bool:
         """Check if current date is during NFL Draft (late April)."""
-        now = datetime.now()
-        # NFL Draft typically occurs last week of April (Thursday-Saturday)
-        draft_start = datetime(self.draft_year, 4, 20)
-        draft_end = datetime(self.draft_year, 4, 27)
-
-        return draft_start <= now <= draft_end
+        return self._draft_window[0] <= time.time() <= self._draft_window[1]
 
     def _get_display_round(self) -> Tuple[int, List[Dict[str, Any]]]:
         """
@@ -604,23 +1071,27 @@ class NFLDraftPlugin(BasePlugin):
         Returns:
             (round_number, picks_list)
         """
-        current_picks = [p for p in self.draft_picks if p.get("round") == self.current_round]
-        current_done = [p for p in current_picks if p.get("player_name", "TBD") != "TBD"]
-
-        if current_done:
-            return self.current_round, current_picks
+        # Single pass: bucket picks by round and note the highest round with a selection
+        picks_by_round: Dict[int, List[Dict[str, Any]]] = {}
+        last_done_round = None
+        current_has_done = False
+        for p in self.draft_picks:
+            round_num = p.get("round", 0)
+            picks_by_round.setdefault(round_num, []).append(p)
+            if p.get("player_name", "TBD") != "TBD":
+                if round_num == self.current_round:
+                    current_has_done = True
+                if last_done_round is None or round_num > last_done_round:
+                    last_done_round = round_num
+
+        if current_has_done:
+            return self.current_round, picks_by_round[self.current_round]
 
         # No selections yet in current_round — show last completed round
-        completed_rounds = sorted(
-            {p.get("round", 0) for p in self.draft_picks
-             if p.get("player_name", "TBD") != "TBD"},
-            reverse=True
-        )
-        if completed_rounds:
-            last = completed_rounds[0]
-            return last, [p for p in self.draft_picks if p.get("round") == last]
+        if last_done_round is not None:
+            return last_done_round, picks_by_round[last_done_round]
 
-        return self.current_round, current_picks  # fallback
+        return self.current_round, picks_by_round.get(self.current_round, [])  # fallback
 
     def _get_favorite_team_picks(self) -> List[Dict[str, Any]]:
         """
@@ -633,7 +1104,7 @@ class NFLDraftPlugin(BasePlugin):
             return []
         fav = [
             p for p in self.draft_picks
-            if p.get("team_abbr", "").upper() in self.favorite_teams
+            if p.get("team_abbr", "").upper() in self._favorite_set
             and p.get("player_name", "TBD") != "TBD"
         ]
         fav.sort(key=lambda x: x.get("pick_number", 0), reverse=True)
@@ -641,57 +1112,64 @@ class NFLDraftPlugin(BasePlugin):
 
     def _create_round_label_item(self, round_num: int) -> Image.Image:
         """Create a scroll item showing 'ROUND X' as a section header in gold."""
+        cached = self._round_label_cache.get(round_num)
+        if cached is not None:
+            return cached
+
         text = f"ROUND {round_num}"
-        temp_img = Image.new('RGB', (1, 1))
-        temp_draw = ImageDraw.Draw(temp_img)
-        try:
-            w = int(temp_draw.textlength(text, font=self.player_name_font))
-        except Exception:
-            bbox = temp_draw.textbbox((0, 0), text, font=self.player_name_font)
-            w = bbox[2] - bbox[0]
+        w = self._measure(text, self.player_name_font, self.player_name_font_size)
         img = Image.new('RGB', (max(w, 1), self.display_height), (0, 0, 0))
         draw = ImageDraw.Draw(img)
         y = (self.display_height - self.player_name_font_size) // 2
         draw.text((0, y), text, font=self.player_name_font, fill=(255, 200, 0))
+        self._round_label_cache[round_num] = img
         return img
 
-    def _create_draft_scroll_image(self) -> None:
-        """Create scrolling image with all draft picks."""
+    def _build_round_labels(self) -> None:
+        """Pre-render the 'ROUND X' label for every draft round."""
+        self._round_label_cache.clear()
+        for round_num in range(1, self.NFL_DRAFT_ROUNDS + 1):
+            self._create_round_label_item(round_num)
+
+    def _build_content_items(self) -> List[Image.Image]:
+        """
+        Build the ordered list of item images shown in the scroll.
+
+        Order: NFL Draft logo, round label (live/simulate only), up to 3
+        favorite-team picks, then the picks of the displayed round.
+        """
         content_items = []
 
         # NFL Draft logo always leads the scroll
         if self.nfl_draft_logo:
             content_items.append(self.nfl_draft_logo)
 
+        # Live or simulation: show the current/last-completed round with round label.
+        # Pre-draft / post-draft: show the most relevant round without a label.
+        display_round, round_picks = self._get_display_round()
         if self.is_draft_live or self.simulate_live:
-            # Live or simulation: show the current/last-completed round with round label
-            display_round, round_picks = self._get_display_round()
             content_items.append(self._create_round_label_item(display_round))
 
-            # Favorite team picks — up to 3 most recent, prepended before round picks
-            for pick in self._get_favorite_team_picks():
-                img = self._create_pick_item(pick)
-                if img:
-                    content_items.append(img)
+        # Favorite team picks — up to 3 most recent, prepended before round picks
+        for pick in self._get_favorite_team_picks() + round_picks:
+            img = self._create_pick_item(pick)
+            if img:
+                content_items.append(img)
 
-            for pick in round_picks:
-                img = self._create_pick_item(pick)
-                if img:
-                    content_items.append(img)
-
-        else:
-            # Pre-draft / post-draft: show the most relevant round via _get_display_round()
-            _, round_picks = self._get_display_round()
+        return content_items
 
-            for pick in self._get_favorite_team_picks():
-                img = self._create_pick_item(pick)
-                if img:
-                    content_items.append(img)
+    def _create_draft_scroll_image(self) -> None:
+        """
+        Create scrolling image with all draft picks.
 
-            for pick in round_picks:
-                img = self._create_pick_item(pick)
-                if img:
-                    content_items.append(img)
+        The item list is built once per data update and kept on
+        self._content_items so Vegas mode can reuse it without re-rendering.
+        ScrollHelper composites the items into a single strip once here and
+        crops the visible window from it on each frame.
+        """
+        content_items = self._build_content_items()
+        self._content_items = content_items
+        self._display_duration = None
 
         if content_items:
             self.scroll_helper.create_scrolling_image(
@@ -703,7 +1181,62 @@ class NFLDraftPlugin(BasePlugin):
         else:
             self.logger.warning("No draft picks to display")
 
+    def _ensure_scroll_image(self) -> None:
+        """Rebuild the scroll image if draft_picks changed since it was last built."""
+        if not self._scroll_dirty:
+            return
+        self._create_draft_scroll_image()
+        # Cleared only after a successful build so a failure is retried next frame
+        self._scroll_dirty = False
+
+        # Keep only renders for the current picks; anything else (a TBD that
+        # became a player, a cleared on-the-clock flag) can't be reused
+        live_keys = {self._pick_item_key(p) for p in self.draft_picks}
+        self._pick_item_cache = OrderedDict(
+            (k, v) for k, v in self._pick_item_cache.items() if k in live_keys
+        )
+
+    def _pick_item_key(self, pick: Dict[str, Any]) -> tuple:
+        """Cache key for a pick's rendered image: its content plus render settings."""
+        return (
+            pick.get("team_abbr", "").upper(),
+            pick.get("player_name", "TBD"),
+            pick.get("position", ""),
+            pick.get("pick_number", 0),
+            pick.get("college", ""),
+            pick.get("on_clock", False),
+            self.font_name,
+            self.player_name_font_size,
+            self.detail_font_size,
+            self.player_color,
+            self.pick_color,
+            self.show_position,
+            self.show_college,
+            self.logo_size,
+        )
+
     def _create_pick_item(self, pick: Dict[str, Any]) -> Optional[Image.Image]:
+        """
+        Return the rendered image for a pick, reusing a cached render when possible.
+
+        Picks are effectively immutable between refreshes, so renders are kept in
+        an LRU keyed by pick content plus the font/color settings that affect the
+        output. A pick whose player changes from TBD gets a new key naturally.
+        """
+        key = self._pick_item_key(pick)
+        cached = self._pick_item_cache.get(key)
+        if cached is not None:
+            self._pick_item_cache.move_to_end(key)
+            return cached
+
+        img = self._render_pick_item(pick)
+        if img is not None:
+            self._pick_item_cache[key] = img
+            if len(self._pick_item_cache) > self.PICK_ITEM_CACHE_SIZE:
+                self._pick_item_cache.popitem(last=False)
+        return img
+
+    def _render_pick_item(self, pick: Dict[str, Any]) -> Optional[Image.Image]:
         """
         Create a single pick item image with logo, name, position, and pick number.
 
@@ -734,34 +1267,21 @@ class NFLDraftPlugin(BasePlugin):
             name_color = self.player_color
 
         # Build detail line: #PICK  POS  (College)
-        detail_parts = []
-
-        # Overall pick number
-        detail_parts.append(f"#{pick.get('pick_number', 0)}")
-
-        # Position
-        if self.show_position and pick.get("position"):
-            detail_parts.append(pick["position"])
-
-        # College (optional)
-        if self.show_college and pick.get("college"):
-            detail_parts.append(f"({pick['college']})")
-
-        detail_text = "  ".join(detail_parts)
-
-        # Calculate text widths using temp draw context
-        temp_img = Image.new('RGB', (1, 1))
-        temp_draw = ImageDraw.Draw(temp_img)
+        pick_number = pick.get("pick_number", 0)
+        position = pick.get("position") if self.show_position else None
+        college = pick.get("college") if self.show_college else None
+        if position and college:
+            detail_text = f"#{pick_number}  {position}  ({college})"
+        elif position:
+            detail_text = f"#{pick_number}  {position}"
+        elif college:
+            detail_text = f"#{pick_number}  ({college})"
+        else:
+            detail_text = f"#{pick_number}"
 
-        try:
-            player_name_width = int(temp_draw.textlength(player_name, font=self.player_name_font))
-            detail_width = int(temp_draw.textlength(detail_text, font=self.detail_font))
-        except Exception:
-            # Fallback for older PIL versions
-            player_bbox = temp_draw.textbbox((0, 0), player_name, font=self.player_name_font)
-            player_name_width = player_bbox[2] - player_bbox[0]
-            detail_bbox = temp_draw.textbbox((0, 0), detail_text, font=self.detail_font)
-            detail_width = detail_bbox[2] - detail_bbox[0]
+        # Calculate text widths (memoized across picks and updates)
+        player_name_width = self._measure(player_name, self.player_name_font, self.player_name_font_size)
+        detail_width = self._measure(detail_text, self.detail_font, self.detail_font_size)
 
         # Calculate total item width (max of player name or detail line, plus logo)
         element_spacing = 6
@@ -777,10 +1297,7 @@ class NFLDraftPlugin(BasePlugin):
         # Paste logo (left side, vertically centered)
         if logo:
             logo_y = (item_height - logo.height) // 2
-            if logo.mode == 'RGBA':
-                item_img.paste(logo, (current_x, logo_y), logo)
-            else:
-                item_img.paste(logo, (current_x, logo_y))
+            item_img.paste(logo, (current_x, logo_y))
             current_x += logo_width + element_spacing
 
         text_start_x = current_x
@@ -804,20 +1321,45 @@ class NFLDraftPlugin(BasePlugin):
         return item_img
 
     def _load_team_logo(self, team_abbr: str) -> Optional[Image.Image]:
-        """Load and resize team logo."""
+        """Return the resized team logo on black, loading it from disk only on first use."""
         if not team_abbr:
             return None
 
-        logo_path = self.logo_base_path / f"{team_abbr}.png"
+        if team_abbr in self._logo_cache:
+            return self._logo_cache[team_abbr]
 
-        logo = self.logo_helper.load_logo(
-            team_abbr,
-            logo_path,
-            max_width=self.logo_size,
-            max_height=self.logo_size
-        )
+        # The preload thread and scroll rebuilds share LogoHelper; load one at a time
+        with self._logo_lock:
+            if team_abbr in self._logo_cache:
+                return self._logo_cache[team_abbr]
+
+            logo_path = self.logo_base_path / f"{team_abbr}.png"
 
-        return logo
+            logo = self.logo_helper.load_logo(
+                team_abbr,
+                logo_path,
+                max_width=self.logo_size,
+                max_height=self.logo_size
+            )
+
+            # Pick items are drawn on black, so flatten transparency onto black once
+            # here and let every render paste the logo without a mask
+            if logo is not None and logo.mode == 'RGBA':
+                flat = Image.new('RGB', logo.size, (0, 0, 0))
+                flat.paste(logo, (0, 0), logo)
+                logo = flat
+
+            # Missing logos are cached as None too, so absent files are probed once
+            self._logo_cache[team_abbr] = logo
+            return logo
+
+    def _preload_team_logos(self) -> None:
+        """Load every team logo into the cache at the configured size."""
+        for team_abbr in self.NFL_TEAM_ABBRS:
+            try:
+                self._load_team_logo(team_abbr)
+            except Exception as e:
+                self.logger.debug(f"Could not preload logo for {team_abbr}: {e}")
 
     def _ensure_logo_installed(self) -> None:
         """
@@ -853,12 +1395,32 @@ class NFLDraftPlugin(BasePlugin):
 
         Transparent borders are auto-cropped before resizing so that the visible
         logo fills as much vertical space as possible on the display.
+
+        The processed canvas is saved as a per-display-size PNG in the plugin's
+        cache directory and reused on later startups while it is newer than the source.
         """
         logo_path = Path("assets/sports/nfl_logos/nfl_draft_logo.png")
         if not logo_path.exists():
             self.logger.warning(f"NFL Draft logo not found at {logo_path}")
             return None
 
+        resample = (
+            Image.Resampling.LANCZOS if self.high_quality_logo_resize
+            else Image.Resampling.BICUBIC
+        )
+        cache_path = self.DISK_CACHE_PATH.parent / (
+            f"nfl_draft_logo.{self.display_width}x{self.display_height}"
+            f"{'.hq' if self.high_quality_logo_resize else ''}.png"
+        )
+        try:
+            if cache_path.exists() and cache_path.stat().st_mtime >= logo_path.stat().st_mtime:
+                with Image.open(cache_path) as cached:
+                    canvas = cached.convert('RGB')
+                self.logger.debug(f"Loaded pre-processed NFL Draft logo from {cache_path}")
+                return canvas
+        except Exception as e:
+            self.logger.debug(f"Ignoring unreadable NFL Draft logo cache {cache_path}: {e}")
+
         try:
             raw = Image.open(logo_path)
             if raw.mode != 'RGBA':
@@ -872,17 +1434,21 @@ class NFLDraftPlugin(BasePlugin):
             if bbox:
                 raw = raw.crop(bbox)
 
-            # Resize to fit within display bounds while preserving aspect ratio
-            raw.thumbnail(
-                (self.display_width // 2, self.display_height),
-                Image.Resampling.LANCZOS
-            )
+            # Resize to fit within display bounds while preserving aspect ratio.
+            # BICUBIC is indistinguishable from LANCZOS at matrix resolution.
+            raw.thumbnail((self.display_width // 2, self.display_height), resample)
 
             # Wrap in a full display_height canvas so it composites cleanly
             canvas = Image.new('RGB', (raw.width, self.display_height), (0, 0, 0))
             y = (self.display_height - raw.height) // 2
             canvas.paste(raw, (0, y), raw)
 
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                canvas.save(cache_path, 'PNG', optimize=True)
+            except Exception as e:
+                self.logger.debug(f"Could not write NFL Draft logo cache {cache_path}: {e}")
+
             self.logger.debug(f"Loaded NFL Draft logo ({raw.width}x{raw.height})")
             return canvas
 
@@ -890,59 +1456,176 @@ class NFLDraftPlugin(BasePlugin):
             self.logger.error(f"Error loading NFL Draft logo: {e}")
             return None
 
+    def _effective_refresh_interval(self) -> float:
+        """
+        Return the refresh interval for the current state, backing off when idle.
+
+        Starts from live_refresh_interval or projection_refresh_interval and
+        multiplies it when the draft is already complete, when it's night-time
+        locally (before REFRESH_ACTIVE_START_HOUR), or when the draft is live but
+        every pick of the current round is in (between rounds). During draft
+        week, before the draft goes live, it is tightened to
+        REFRESH_DRAFT_WEEK_INTERVAL (REFRESH_DRAFT_EVENING_INTERVAL from
+        REFRESH_DRAFT_EVENING_START_HOUR) so the switch to live isn't missed.
+        Capped at REFRESH_MAX_INTERVAL.
+        """
+        interval = self.live_refresh_interval if self.is_draft_live else self.projection_refresh_interval
+
+        if not self.is_draft_live and self.draft_status == "complete":
+            interval *= self.REFRESH_COMPLETE_MULTIPLIER
+
+        if datetime.now().hour < self.REFRESH_ACTIVE_START_HOUR:
+            interval *= self.REFRESH_NIGHT_MULTIPLIER
+
+        if self.is_draft_live and all(
+            p.get("player_name") != "TBD"
+            for p in self.draft_picks if p.get("round") == self.current_round
+        ):
+            interval *= self.REFRESH_BETWEEN_ROUNDS_MULTIPLIER
+
+        if not self.is_draft_live and self._is_draft_date():
+            if datetime.now().hour >= self.REFRESH_DRAFT_EVENING_START_HOUR:
+                interval = min(interval, self.REFRESH_DRAFT_EVENING_INTERVAL)
+            else:
+                interval = min(interval, self.REFRESH_DRAFT_WEEK_INTERVAL)
+
+        return min(interval, self.REFRESH_MAX_INTERVAL)
+
     def update(self) -> None:
         """
         Fetch/update draft data from ESPN API.
 
         Called based on update_interval in manifest.
         Implements dual-mode logic:
-        - During live draft: refresh every 10 minutes, show current round only
+        - During live draft: refresh every minute, show current round only
         - Off-season: daily refresh, show projected picks for configured rounds
+
+        Network I/O runs on a background thread (see _fetch_update) so the
+        scroll keeps moving; the result is applied by _collect_update, which
+        display() also calls so new picks appear as soon as they are parsed.
         """
+        self._collect_update()
+        if self._pending_update is not None:
+            return
+
         current_time = time.time()
 
-        # Determine refresh interval based on mode
-        refresh_interval = self.live_refresh_interval if self.is_draft_live else self.projection_refresh_interval
+        # Determine refresh interval based on mode, time of day and draft progress
+        refresh_interval = self._effective_refresh_interval()
 
         # Check if refresh is needed
         if self.last_update_time is not None and current_time - self.last_update_time < refresh_interval:
             return
 
         self.logger.info(f"Updating NFL Draft data (live={self.is_draft_live}, year={self.draft_year}, simulate={self.simulate_live})")
+        self.last_update_time = current_time
+        self._pending_update = self._update_executor.submit(self._fetch_update)
 
+    def _collect_update(self) -> None:
+        """Apply the background fetch's result on the calling thread once it has finished."""
+        future = self._pending_update
+        if future is None or not future.done():
+            return
+        self._pending_update = None
         try:
-            if self.simulate_live:
-                # Simulation mode: fetch real picks from core API for a completed draft
-                # year and display them as-is (all configured rounds, no live filtering)
-                self.draft_status = "simulate"
-                self.draft_picks = self._fetch_historical_picks()
-            else:
-                # Normal mode: fetch from site API (live or projected picks)
-                # also updates self.is_draft_live and self.current_round from API response
-                self.draft_picks = self._fetch_draft_picks()
-
-            # Sort by pick number
-            self.draft_picks.sort(key=lambda x: x.get("pick_number", 0))
-
-            # Mark the "on the clock" pick — first TBD pick in the current round
-            # during a real live draft (not simulation, which has all picks filled in)
-            for pick in self.draft_picks:
-                pick.pop("on_clock", None)  # clear any stale flag
-            if self.is_draft_live and not self.simulate_live:
-                for pick in self.draft_picks:
-                    if (pick.get("player_name") == "TBD"
-                            and pick.get("round") == self.current_round):
-                        pick["on_clock"] = True
-                        break
-
-            # Create scroll image
-            self._create_draft_scroll_image()
-
-            self.last_update_time = current_time
-            self.logger.info(f"Loaded {len(self.draft_picks)} draft picks")
-
+            result = future.result()
         except Exception as e:
             self.logger.error(f"Error updating draft data: {e}", exc_info=True)
+            # Retry on the next update() rather than after a full interval
+            self.last_update_time = None
+            return
+        self._apply_update(result)
+
+    def _fetch_update(self) -> Tuple[Optional[Tuple[str, Optional[int]]],
+                                     Optional[List[Dict[str, Any]]], Optional[tuple]]:
+        """
+        Fetch and parse draft picks for update(). Runs on the update thread.
+
+        Only reads plugin state; everything it produces is returned and
+        installed by _apply_update on the caller's thread.
+
+        Returns:
+            (status, sorted picks, data version). status is a
+            _parse_draft_status tuple, or None if ESPN could not be reached;
+            picks is None when the picks on screen should be kept (ESPN
+            reported no change, or could not be reached)
+        """
+        version = None
+        if self.simulate_live:
+            # Simulation mode: fetch real picks from core API for a completed draft
+            # year and display them as-is (all configured rounds, no live filtering)
+            status = ("simulate", None)
+            picks = self._fetch_historical_picks()
+        else:
+            # Normal mode: fetch from site API (live or projected picks).
+            # The response is fetched once here and threaded through.
+            data = self._fetch_draft_data()
+            if not data and self.draft_picks:
+                # ESPN unreachable — keep showing the picks we have
+                self.logger.warning("No draft data returned from ESPN API; keeping current picks")
+                return None, None, None
+            status = self._parse_draft_status(data) if data else None
+            draft_status = status[0] if status else self.draft_status
+            if draft_status == "pre":
+                # Mock picks also depend on the prospects list; look it up first so
+                # its own SWR entry is revalidated and its validators are current
+                self._fetch_all_prospects()
+            version = self._draft_data_validators(data, draft_status)
+            if version is not None and version == self._rendered_version and self.draft_picks:
+                return status, None, version
+            picks = self._fetch_draft_picks(data=data, draft_status=draft_status)
+
+        # Sort by pick number — ESPN returns picks in order, so usually skip it
+        pick_numbers = [p["pick_number"] for p in picks]
+        if any(a > b for a, b in zip(pick_numbers, pick_numbers[1:])):
+            picks.sort(key=itemgetter("pick_number"))
+        return status, picks, version
+
+    def _apply_update(self, result: Tuple[Optional[Tuple[str, Optional[int]]],
+                                          Optional[List[Dict[str, Any]]], Optional[tuple]]) -> None:
+        """Install status and picks from _fetch_update and mark the scroll for rebuild if needed."""
+        status, picks, version = result
+        if status is not None:
+            self._apply_draft_status(status)
+        if picks is None:
+            # ESPN reported no change — skip re-parsing and rebuilding the scroll
+            self.logger.debug("Draft data not modified; keeping current scroll image")
+            return
+
+        self.draft_picks = picks
+
+        # Find the "on the clock" pick — first TBD pick in the current round
+        # during a real live draft (not simulation, which has all picks filled in)
+        on_clock_idx = None
+        if self.is_draft_live and not self.simulate_live:
+            on_clock_idx = next(
+                (i for i, p in enumerate(self.draft_picks)
+                 if p.get("player_name") == "TBD" and p.get("round") == self.current_round),
+                None
+            )
+        # Picks are freshly built each fetch, so only the new index needs the flag
+        if on_clock_idx is not None:
+            self.draft_picks[on_clock_idx]["on_clock"] = True
+
+        # Skip the rebuild when nothing visible changed since the last one
+        picks_hash = hash((
+            self.is_draft_live,
+            self.current_round,
+            tuple(self._pick_item_key(p) for p in self.draft_picks),
+        ))
+        self._rendered_version = version
+        if (on_clock_idx == self._on_clock_idx
+                and picks_hash == self._last_picks_hash
+                and (self._content_items or self._scroll_dirty)):
+            self.logger.debug("Draft picks unchanged; keeping current scroll image")
+            return
+
+        self._on_clock_idx = on_clock_idx
+        self._last_picks_hash = picks_hash
+
+        # Rebuild the scroll image lazily, the next time it is displayed
+        self._scroll_dirty = True
+        self.logger.info(f"Loaded {len(self.draft_picks)} draft picks")
 
     def display(self, force_clear: bool = False) -> None:
         """
@@ -953,14 +1636,21 @@ class NFLDraftPlugin(BasePlugin):
         Args:
             force_clear: If True, clear display before rendering
         """
+        # Pick up a finished background fetch without waiting for update()
+        self._collect_update()
+
         if force_clear:
             self.display_manager.clear()
+            self._last_frame_hash = None
 
         if not self.draft_picks:
             self._display_no_data()
             return
 
         try:
+            # Build the scroll image on first display after a data change
+            self._ensure_scroll_image()
+
             # Update scroll position
             self.scroll_helper.update_scroll_position()
 
@@ -968,6 +1658,12 @@ class NFLDraftPlugin(BasePlugin):
             visible_image = self.scroll_helper.get_visible_portion()
 
             if visible_image:
+                # Skip the hardware push when the frame hasn't changed (paused or slow scroll)
+                frame_hash = hash(visible_image.tobytes())
+                if frame_hash == self._last_frame_hash:
+                    return
+                self._last_frame_hash = frame_hash
+
                 # Set image to display manager
                 self.display_manager.image = visible_image
                 self.display_manager.update_display()
@@ -976,45 +1672,41 @@ class NFLDraftPlugin(BasePlugin):
             self.logger.error(f"Error displaying draft: {e}")
             self._display_error()
 
-    def _display_no_data(self) -> None:
-        """Display a no data message."""
-        img = Image.new('RGB', (self.display_width, self.display_height), (0, 0, 0))
-        draw = ImageDraw.Draw(img)
+    def _get_message_image(self, message: str, background: Tuple[int, int, int],
+                           color: Tuple[int, int, int]) -> Image.Image:
+        """Return a full-display image with message centered, rendering it only once."""
+        img = self._message_images.get(message)
+        if img is None:
+            img = Image.new('RGB', (self.display_width, self.display_height), background)
+            draw = ImageDraw.Draw(img)
 
-        message = "No Draft Data"
-        try:
-            text_width = draw.textlength(message, font=self.detail_font)
-        except Exception:
-            bbox = draw.textbbox((0, 0), message, font=self.detail_font)
-            text_width = bbox[2] - bbox[0]
+            text_width = self._measure(message, self.detail_font, self.detail_font_size)
 
-        x = (self.display_width - text_width) // 2
-        y = (self.display_height - self.detail_font_size) // 2
+            x = (self.display_width - text_width) // 2
+            y = (self.display_height - self.detail_font_size) // 2
 
-        draw.text((x, y), message, font=self.detail_font, fill=(150, 150, 150))
+            draw.text((x, y), message, font=self.detail_font, fill=color)
+            self._message_images[message] = img
+        return img
 
-        self.display_manager.image = img
+    def _show_message(self, message: str, background: Tuple[int, int, int],
+                      color: Tuple[int, int, int]) -> None:
+        """Push a status message frame, skipping the push while it is already showing."""
+        frame_key = hash(("message", message))
+        if frame_key == self._last_frame_hash:
+            return
+        self._last_frame_hash = frame_key
+        # Hand over a copy; the display manager may draw on its image later
+        self.display_manager.image = self._get_message_image(message, background, color).copy()
         self.display_manager.update_display()
 
+    def _display_no_data(self) -> None:
+        """Display a no data message."""
+        self._show_message("No Draft Data", (0, 0, 0), (150, 150, 150))
+
     def _display_error(self) -> None:
         """Display an error message."""
-        img = Image.new('RGB', (self.display_width, self.display_height), (50, 0, 0))
-        draw = ImageDraw.Draw(img)
-
-        message = "Error"
-        try:
-            text_width = draw.textlength(message, font=self.detail_font)
-        except Exception:
-            bbox = draw.textbbox((0, 0), message, font=self.detail_font)
-            text_width = bbox[2] - bbox[0]
-
-        x = (self.display_width - text_width) // 2
-        y = (self.display_height - self.detail_font_size) // 2
-
-        draw.text((x, y), message, font=self.detail_font, fill=(255, 100, 100))
-
-        self.display_manager.image = img
-        self.display_manager.update_display()
+        self._show_message("Error", (50, 0, 0), (255, 100, 100))
 
     def supports_dynamic_duration(self) -> bool:
         """Enable dynamic duration based on scroll completion."""
@@ -1031,7 +1723,11 @@ class NFLDraftPlugin(BasePlugin):
     def get_display_duration(self) -> float:
         """Get display duration, using dynamic duration from scroll helper."""
         if self.supports_dynamic_duration():
-            return float(self.scroll_helper.get_dynamic_duration())
+            # Duration depends on the scroll width, so build it first if stale
+            self._ensure_scroll_image()
+            if self._display_duration is None:
+                self._display_duration = float(self.scroll_helper.get_dynamic_duration())
+            return self._display_duration
         return self.config.get('display_duration', 60.0)
 
     # -------------------------------------------------------------------------
@@ -1053,38 +1749,9 @@ class NFLDraftPlugin(BasePlugin):
         if not self.draft_picks:
             return None
 
-        images = []
-
-        if self.nfl_draft_logo:
-            images.append(self.nfl_draft_logo)
-
-        if self.is_draft_live or self.simulate_live:
-            display_round, round_picks = self._get_display_round()
-            images.append(self._create_round_label_item(display_round))
-
-            for pick in self._get_favorite_team_picks():
-                img = self._create_pick_item(pick)
-                if img:
-                    images.append(img)
-
-            for pick in round_picks:
-                img = self._create_pick_item(pick)
-                if img:
-                    images.append(img)
-
-        else:
-            _, round_picks = self._get_display_round()
-
-            for pick in self._get_favorite_team_picks():
-                img = self._create_pick_item(pick)
-                if img:
-                    images.append(img)
-
-            for pick in round_picks:
-                img = self._create_pick_item(pick)
-                if img:
-                    images.append(img)
-
+        # Reuse the items built for the last scroll image when available
+        self._ensure_scroll_image()
+        images = list(self._content_items) if self._content_items else self._build_content_items()
         return images if images else None
 
     def has_live_priority(self) -> bool:
@@ -1117,18 +1784,67 @@ class NFLDraftPlugin(BasePlugin):
 
     def cleanup(self) -> None:
         """Cleanup resources."""
-        if hasattr(self, 'scroll_helper'):
+        if self.scroll_helper is not None:
             self.scroll_helper.clear_cache()
-        if hasattr(self, 'logo_helper'):
+        if self.logo_helper is not None:
             self.logo_helper.clear_cache()
+        self._pick_item_cache.clear()
+        self._content_items = []
+        with self._logo_lock:
+            self._logo_cache.clear()
+        self._message_images.clear()
+        self._text_width_cache.clear()
+        with self._disk_cache_lock:
+            self._disk_cache_closed = True
+            if self._disk_cache is not None:
+                self._disk_cache.close()
+                self._disk_cache = None
+        self._pending_update = None
+        self._update_executor.shutdown(wait=False)
+        if self._http_session is not None:
+            self._http_session.close()
         super().cleanup()
 
     def on_config_change(self, new_config: Dict[str, Any]) -> None:
         """Handle configuration changes."""
+        old_font_name = self.font_name
+        old_player_size = self.player_name_font_size
+        old_detail_size = self.detail_font_size
+        old_logo_size = self.logo_size
+        old_high_quality_logo_resize = self.high_quality_logo_resize
         super().on_config_change(new_config)
         self._load_config()
-        self.player_name_font = self._load_font(self.player_name_font_size)
-        self.detail_font = self._load_font(self.detail_font_size)
+
+        # Only reload fonts, and forget measured widths, for what actually changed
+        if self.font_name != old_font_name:
+            self._text_width_cache.clear()
+        else:
+            stale_sizes = {old_player_size, old_detail_size} - {
+                self.player_name_font_size, self.detail_font_size
+            }
+            for key in [k for k in self._text_width_cache if k[0] in stale_sizes]:
+                del self._text_width_cache[key]
+        if self.font_name != old_font_name or self.player_name_font_size != old_player_size:
+            self.player_name_font = self._get_font(self.player_name_font_size)
+            self._build_round_labels()
+        if self.font_name != old_font_name or self.detail_font_size != old_detail_size:
+            self.detail_font = self._get_font(self.detail_font_size)
+        if self.logo_size != old_logo_size:
+            with self._logo_lock:
+                self._logo_cache.clear()
+        if self.high_quality_logo_resize != old_high_quality_logo_resize:
+            self.nfl_draft_logo = self._load_nfl_draft_logo()
+        self._pick_item_cache.clear()
+        self._content_items = []
+        self._message_images.clear()
+        self._last_frame_hash = None
+        # Re-render the current picks with the new settings on the next frame
+        self._scroll_dirty = bool(self.draft_picks)
+        self._rendered_version = None
+        self._last_picks_hash = None
+        self._display_duration = None
+        # Drop any fetch started under the old config
+        self._pending_update = None
 
         # Force data refresh on config change
         self.last_update_time = None